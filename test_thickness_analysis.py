@@ -0,0 +1,94 @@
+"""
+Tests de non-régression de thickness_analysis
+"""
+
+import numpy as np
+import pytest
+
+import thickness_analysis as ta
+
+
+def test_fast_stats_std_large_mean_small_spread():
+    # Grande moyenne, faible dispersion : E[x²] - E[x]² non décalé perdait ~15 % à 20M lignes
+    rng = np.random.default_rng(0)
+    for mean, std in ((363.787, 1e-3), (2.5, 1e-4)):
+        data = (mean + std * rng.standard_normal(2_000_000)).astype(ta.DATA_DTYPE)
+        stats = ta._fast_stats(data)
+        assert np.isclose(stats['Écart-type'], data.std(dtype=np.float64), rtol=1e-6)
+        assert np.isclose(stats['Moyenne'], data.mean(dtype=np.float64), rtol=1e-12)
+
+
+def test_fast_stats_with_infinite_values():
+    for data in (np.array([1.0, 100.0, np.inf, 5.0], dtype=ta.DATA_DTYPE),
+                 np.array([-np.inf, 100.0, 3.0, 100.0], dtype=ta.DATA_DTYPE)):
+        stats = ta._fast_stats(data, is_percentage=True)
+        assert stats['Moyenne'] == data.mean(dtype=np.float64)
+        assert stats['Minimum'] == data.min()
+        assert stats['Maximum'] == data.max()
+        assert stats['Temps à 100%'] == np.count_nonzero(data == 100) * 100.0 / data.size
+        with np.errstate(invalid='ignore'):
+            assert np.isnan(stats['Écart-type']) and np.isnan(data.std(dtype=np.float64))
+
+# Lecteurs : pyarrow ou pandas typé, puis noyau Numba ou pandas en texte pour le repli tolérant
+BACKENDS = [(pacsv, njit) for pacsv in (ta.pacsv, None) for njit in (ta.njit, None)]
+
+
+@pytest.mark.parametrize('pacsv, njit', BACKENDS)
+@pytest.mark.parametrize('content, expected', [
+    # Ligne plus longue seule : jamais écartée, elle donne la largeur de la matrice
+    ('% en-tête\n0,1,2\n60,3,4,5,6\n120,5,6\n',
+     [[0, 1, 2, np.nan, np.nan], [1, 3, 4, 5, 6], [2, 5, 6, np.nan, np.nan]]),
+    # Ligne longue, ligne courte, cellule invalide et infini : repli tolérant
+    ('% en-tête\n0,1,2\n60,3,4,5,6\n120,x,7\n180,inf,8\n240,9\n',
+     [[0, 1, 2, np.nan, np.nan], [1, 3, 4, 5, 6], [2, np.nan, 7, np.nan, np.nan],
+      [3, np.inf, 8, np.nan, np.nan], [4, 9, np.nan, np.nan, np.nan]]),
+])
+def test_backends_agree_on_malformed_rows(tmp_path, monkeypatch, pacsv, njit, content, expected):
+    monkeypatch.setattr(ta, 'pacsv', pacsv)
+    monkeypatch.setattr(ta, 'njit', njit)
+    ta._load_thickness_file_cached.cache_clear()
+    file_path = tmp_path / 'malformed.csv'
+    file_path.write_text(content)
+    try:
+        data = ta._load_thickness_file(str(file_path))
+    finally:
+        ta._load_thickness_file_cached.cache_clear()
+    np.testing.assert_array_equal(data, np.array(expected, dtype=ta.DATA_DTYPE))
+
+
+@pytest.mark.parametrize('pacsv, njit', BACKENDS)
+def test_width_from_widest_row(tmp_path, monkeypatch, pacsv, njit):
+    # Première ligne courte : la largeur vient de la ligne la plus longue, pas de la première
+    monkeypatch.setattr(ta, 'pacsv', pacsv)
+    monkeypatch.setattr(ta, 'njit', njit)
+    ta._load_thickness_file_cached.cache_clear()
+    ta._column_statistics_cached.cache_clear()
+    file_path = tmp_path / 'short_first_row.csv'
+    file_path.write_text('% en-tête\n0,1\n60,2,3,4,\n120,5,6,7,\n')
+    try:
+        _, last = ta.extract_thickness_data(str(file_path), -1)
+        _, first = ta.extract_thickness_data(str(file_path), 1)
+    finally:
+        ta._load_thickness_file_cached.cache_clear()
+        ta._column_statistics_cached.cache_clear()
+    np.testing.assert_array_equal(last, [4, 7])
+    np.testing.assert_array_equal(first, [1, 2, 5])
+
+
+@pytest.mark.parametrize('text', [
+    'inf', '-inf', '+Infinity', '-INFINITY', '+1.5', '-2.5e+3', '1E30', '.5', '5.', '-0',
+    '95.0000000000000000', '0.0512330000000000', '1.2095959999999999', '100.0430120000000045',
+    '0.30000000000000004', '9007199254740993', '123456789012345678901234', '1e22', '1e23',
+    '1e-30', '7.038531e-26', '3.4028235e38', '3.4028236e38', '1e400', '1e-400',
+    # Milieu exact entre deux float32 voisins, puis juste au-dessus
+    '16777217', '16777217.000000000000000001',
+])
+def test_parse_float_matches_python(tmp_path, text):
+    # Noyau Numba du lecteur tolérant : même valeur que float() converti en DATA_DTYPE
+    pytest.importorskip('numba')
+    file_path = tmp_path / 'value.csv'
+    file_path.write_text(f'% en-tête\n0,{text}\n')
+    data = ta._read_columns_tolerant(str(file_path), len('% en-tête\n'.encode()))
+    with np.errstate(over='ignore'):
+        expected = ta.DATA_DTYPE(float(text))
+    assert data[0, 1] == expected and np.signbit(data[0, 1]) == np.signbit(expected)
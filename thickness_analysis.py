@@ -9,14 +9,36 @@ Author: OpenHands AI Assistant
 Date: 2025-08-13
 """
 
+import os
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Mode sans affichage (batch/CI) : backend Agg, figures enregistrées en PNG au lieu de plt.show()
+HEADLESS = os.environ.get('THICKNESS_HEADLESS', '') not in ('', '0')
+if HEADLESS:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 import warnings
-import os
-from typing import Tuple, Dict, List, Any
+import functools
+import re
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Dict, List, Any, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow est optionnel : repli sur le parseur C de pandas
+    pacsv = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba est optionnel : repli sur NumPy
+    njit = None
 
 warnings.filterwarnings('ignore')
 
@@ -26,12 +48,147 @@ sns.set_palette("husl")
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 10
 
+# Nombre de lignes CSV lues par bloc (borne la mémoire crête du parseur)
+CSV_CHUNK_SIZE = 200_000
+
+# Type de stockage des données extraites : la précision de float32 (~7 chiffres
+# significatifs) suffit pour la télémétrie, les réductions accumulent en float64
+DATA_DTYPE = np.float32
+
+# Constantes de tracé partagées par tous les appels de create_comparative_plots
+_PCT_BINS = np.linspace(0, 100, 21)
+_PCT_BINS.flags.writeable = False
+_PCT_CATEGORIES = ['0-65%', '65-70%', '70-75%', '75-80%', '80-85%', '85-90%', '90-95%', '95-100%']
+# Bornes des catégories : [-inf, 65[, [65, 70[, ..., [95, +inf] (inclut 100%)
+_PCT_CATEGORY_EDGES = np.array([-np.inf, 65, 70, 75, 80, 85, 90, 95, np.inf])
+_PCT_CATEGORY_EDGES.flags.writeable = False
+_LINE_KW = dict(linewidth=1.5, alpha=0.8)
+_REF_LINE_KW = dict(linestyle='--', alpha=0.6)
+_HIST_KW = dict(alpha=0.6, density=True)
+_TITLE_KW = dict(fontweight='bold', fontsize=12)
+_MEAN_LABEL_BBOX = dict(boxstyle="round,pad=0.2", facecolor="yellow", alpha=0.7)
+
+# Figures réutilisées d'une analyse à l'autre : nom -> (figure, axes)
+_FIGURES: Dict[str, Tuple[plt.Figure, np.ndarray]] = {}
+
+# Dossier de sortie des figures en mode sans affichage
+FIGURES_DIR = os.environ.get('THICKNESS_FIGURES_DIR', 'figures')
+
+# Nombre de fichiers lus gardés en cache (les plus récemment utilisés)
+FILE_CACHE_SIZE = 8
+
+
+def _scan_header(file_path: str) -> Tuple[int, bytes]:
+    """
+    Localise la fin de l'en-tête % par recherche d'octets sur le fichier mappé en mémoire
+    
+    Args:
+        file_path: Chemin vers le fichier CSV
+    
+    Returns:
+        Tuple contenant (position en octets de la première ligne de données, cette ligne)
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return 0, b''
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offset = 0
+            size = len(mm)
+            while offset < size:
+                line_end = mm.find(b'\n', offset)
+                if line_end == -1:
+                    line_end = size
+                line = mm[offset:line_end]
+                if not line.startswith(b'%') and line.strip():
+                    return offset, line
+                offset = line_end + 1
+    return offset, b''
+
+
+def _cache_key(file_path: str) -> Tuple[str, float]:
+    """
+    Clé de cache d'un fichier, à calculer une seule fois par appel
+    
+    Une seule clé par appel : la matrice, la colonne résolue et ses vues viennent de la
+    même version du fichier, même s'il est modifié pendant l'appel.
+    
+    Args:
+        file_path: Chemin vers le fichier CSV
+    
+    Returns:
+        Tuple contenant (chemin absolu, date de modification)
+    """
+    return os.path.abspath(file_path), os.path.getmtime(file_path)
+
+
+def _load_thickness_file(file_path: str) -> np.ndarray:
+    """
+    Lit toutes les colonnes numériques d'un fichier CSV en une seule passe
+    
+    La matrice est mise en cache tant que le fichier n'est pas modifié : toutes les
+    métriques d'un même fichier en sont des tranches. Elle est stockée colonne par
+    colonne (ordre Fortran) pour que chaque colonne soit contiguë, et en lecture seule.
+    La colonne 0 est convertie une fois pour toutes en minutes.
+    
+    Args:
+        file_path: Chemin vers le fichier CSV
+    
+    Returns:
+        Matrice (N, colonnes) des valeurs, en lecture seule
+    """
+    return _load_thickness_file_cached(*_cache_key(file_path))[0]
+
+
+@functools.lru_cache(maxsize=FILE_CACHE_SIZE)
+def _load_thickness_file_cached(file_path: str, mtime: float
+                                ) -> Tuple[np.ndarray, bool, Dict[int, Tuple[np.ndarray, np.ndarray]]]:
+    """
+    Lecture effective de _load_thickness_file, mémoïsée sur (chemin absolu, mtime)
+    
+    Le cache LRU est borné : une version périmée d'un fichier modifié finit par être
+    évincée au lieu de rester en mémoire. L'entrée porte aussi les colonnes filtrées
+    par _column_views, évincées en même temps que leur matrice.
+    
+    Args:
+        file_path: Chemin absolu vers le fichier CSV
+        mtime: Date de modification du fichier (clé d'invalidation)
+    
+    Returns:
+        Tuple contenant (matrice (N, colonnes), True si aucune valeur manquante,
+        dictionnaire colonne -> (times, values) filtrés, rempli par _column_views)
+    """
+    data_offset, first_row = _scan_header(file_path)
+    if not first_row:
+        raise ValueError(f"Aucune ligne de données dans {file_path}")
+    
+    try:
+        if pacsv is not None:
+            # Toute ligne au nombre de champs différent de la première lève pa.ArrowInvalid :
+            # une lecture réussie a la largeur de la première ligne
+            data = _read_columns_pyarrow(file_path, _row_width(first_row), data_offset)
+        else:
+            # pandas garde sans erreur les premiers champs d'une ligne plus longue : largeur
+            # de la ligne la plus longue, mesurée avant la lecture
+            n_columns, _ = _scan_row_widths(file_path, data_offset)
+            data = _read_columns_pandas(file_path, n_columns, len(first_row) + 1)
+    except ValueError:  # pa.ArrowInvalid en dérive : pas de seconde lecture typée vouée à l'échec
+        # Cellule non numérique ou ligne au nombre de champs différent : cellules en NaN,
+        # écartées pour leur colonne seulement ; largeur de la ligne la plus longue
+        data = _read_columns_tolerant(file_path, data_offset)
+    
+    data[:, 0] /= 60.0  # Temps en minutes, sur place : le buffer vient d'être alloué
+    data.flags.writeable = False
+    return data, not np.isnan(data).any(), {}
+
 
 def extract_thickness_data(file_path: str, column_index: int, min_columns: int = 2, 
                           is_percentage: bool = False) -> Tuple[np.ndarray, np.ndarray]:
     """
     Extrait les données de temps et d'épaisseur/pourcentage d'un fichier CSV
     
+    Le fichier n'est lu qu'une fois pour toutes ses colonnes (voir _load_thickness_file) :
+    les tableaux retournés sont des vues partagées, en lecture seule, sans copie.
+    
     Args:
         file_path: Chemin vers le fichier CSV
         column_index: Index de la colonne à extraire (-1 pour la dernière)
@@ -41,32 +198,549 @@ def extract_thickness_data(file_path: str, column_index: int, min_columns: int =
     Returns:
         Tuple contenant (times, values) - arrays numpy des temps et valeurs
     """
-    with open(file_path, 'r', encoding='utf-8') as file:
-        lines = file.readlines()
+    entry = _load_thickness_file_cached(*_cache_key(file_path))
+    col = _resolve_column(file_path, entry[0].shape[1], column_index, min_columns)
+    return _column_views(entry, col)
+
+
+def _resolve_column(file_path: str, n_columns: int, column_index: int, min_columns: int) -> int:
+    """
+    Convertit un index de colonne éventuellement négatif en index réel, une fois par appel
+    
+    Args:
+        file_path: Chemin vers le fichier CSV (pour le message d'erreur)
+        n_columns: Nombre de colonnes du fichier
+        column_index: Index de la colonne (-1 pour la dernière)
+        min_columns: Nombre minimum de colonnes requis
+    
+    Returns:
+        Index de colonne positif
+    """
+    col = column_index + n_columns if column_index < 0 else column_index
+    if n_columns < min_columns or not 0 <= col < n_columns:
+        raise ValueError(f"{file_path}: {n_columns} colonnes, colonne {column_index} "
+                         f"(minimum {min_columns}) indisponible")
+    return col
+
+
+def _column_views(entry: Tuple[np.ndarray, bool, Dict[int, Tuple[np.ndarray, np.ndarray]]],
+                  col: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tableaux (temps, valeurs) d'une colonne de la matrice en cache
+    
+    Pour un fichier complet ce sont des vues de la matrice, sans copie. Sinon le filtrage
+    des NaN produit une copie par colonne : elle est faite une seule fois, gardée dans
+    l'entrée de cache du fichier et partagée par les graphiques et les statistiques.
+    
+    Args:
+        entry: Entrée de _load_thickness_file_cached du fichier
+        col: Index de colonne positif, déjà validé
+    
+    Returns:
+        Tuple contenant (times, values) en lecture seule
+    """
+    data, complete, filtered = entry
+    if complete:
+        return data[:, 0], data[:, col]
+    
+    cached = filtered.get(col)
+    if cached is None:
+        # Lignes trop courtes ou cellules vides : écartées pour cette colonne seulement
+        times = data[:, 0]
+        values = data[:, col]
+        valid = ~(np.isnan(times) | np.isnan(values))
+        times = times[valid]
+        values = values[valid]
+        times.flags.writeable = False
+        values.flags.writeable = False
+        cached = filtered[col] = (times, values)
+    return cached
+
+
+def _read_columns_pyarrow(file_path: str, n_columns: int, data_offset: int) -> np.ndarray:
+    """
+    Lit les n_columns premières colonnes avec le lecteur CSV pyarrow
+    
+    Le fichier est mappé en mémoire et le lecteur part directement de la première ligne
+    de données, sans copie du texte ni relecture de l'en-tête. Le lecteur pyarrow est
+    multi-thread ; les cellules vides deviennent NaN. Une ligne au nombre de champs
+    différent lève pa.ArrowInvalid (le fichier passe alors au lecteur tolérant, qui la
+    garde), plutôt que d'être ignorée pour toutes les colonnes.
+    
+    Args:
+        file_path: Chemin vers le fichier CSV
+        n_columns: Nombre de colonnes de données
+        data_offset: Position en octets de la première ligne de données
+    
+    Returns:
+        Matrice (N, n_columns) des valeurs brutes, en ordre Fortran
+    """
+    names = [f'f{i}' for i in range(n_columns)]
+    with pa.memory_map(file_path) as source:
+        source.seek(data_offset)
+        table = pacsv.read_csv(
+            pa.BufferReader(source.read_buffer()),
+            read_options=pacsv.ReadOptions(autogenerate_column_names=True),
+            parse_options=pacsv.ParseOptions(delimiter=',', invalid_row_handler=lambda row: 'error'),
+            convert_options=pacsv.ConvertOptions(include_columns=names,
+                                                 column_types={name: pa.from_numpy_dtype(DATA_DTYPE) for name in names})
+        )
+    
+    # Copie de chaque bloc pyarrow directement dans sa colonne (vue sans copie côté
+    # pyarrow quand le bloc n'a pas de valeur nulle), sans concaténation intermédiaire
+    data = np.empty((table.num_rows, n_columns), dtype=DATA_DTYPE, order='F')
+    for i in range(n_columns):
+        start = 0
+        for chunk in table.column(i).chunks:
+            end = start + len(chunk)
+            data[start:end, i] = chunk.to_numpy(zero_copy_only=False)
+            start = end
+    return data
+
+
+def _read_columns_pandas(file_path: str, n_columns: int, row_bytes: int) -> np.ndarray:
+    """
+    Lit les n_columns premières colonnes avec le parseur C de pandas
+    
+    Args:
+        file_path: Chemin vers le fichier CSV
+        n_columns: Nombre de colonnes de données
+        row_bytes: Taille en octets d'une ligne de données type
+    
+    Returns:
+        Matrice (N, n_columns) des valeurs brutes, en ordre Fortran
+    """
+    # Lecture par blocs : les lignes d'en-tête % sont ignorées comme commentaires.
+    # Types imposés et sans recherche de valeurs manquantes (na_filter=False) : une
+    # cellule vide ou non numérique lève ValueError et le fichier passe au lecteur
+    # tolérant. Aucune ligne n'est écartée en silence (on_bad_lines='error') : une
+    # ligne trop courte lève aussi ValueError, une ligne plus longue garde ses
+    # n_columns premiers champs. Les blocs sont copiés dans un buffer pré-dimensionné
+    # (pas de liste de blocs ni de concaténation)
+    data = np.empty((_estimate_row_count(file_path, row_bytes), n_columns), dtype=DATA_DTYPE, order='F')
+    n_rows = 0
+    with pd.read_csv(file_path, comment='%', header=None, sep=',', skipinitialspace=True,
+                     usecols=range(n_columns), dtype=DATA_DTYPE, engine='c', na_filter=False,
+                     on_bad_lines='error', chunksize=CSV_CHUNK_SIZE) as reader:
+        for chunk in reader:
+            end = n_rows + len(chunk)
+            if end > data.shape[0]:
+                grown = np.empty((max(2 * data.shape[0], end), n_columns), dtype=DATA_DTYPE, order='F')
+                grown[:n_rows] = data[:n_rows]
+                data = grown
+            data[n_rows:end] = chunk.to_numpy()
+            n_rows = end
+    
+    return data[:n_rows]
+
+
+def _map_bytes(file_path: str) -> np.ndarray:
+    """
+    Mappe un fichier en mémoire, en lecture seule, sous forme de tableau d'octets
+    
+    Le mapping est libéré avec le dernier tableau qui le référence, sans fermeture
+    explicite : la première compilation d'un noyau Numba peut garder une référence
+    à son argument jusqu'au prochain passage du ramasse-miettes.
+    
+    Args:
+        file_path: Chemin vers le fichier (non vide)
+    
+    Returns:
+        Tableau uint8 du contenu du fichier
+    """
+    return np.asarray(np.memmap(file_path, dtype=np.uint8, mode='r'))
+
+
+def _row_width(line: bytes) -> int:
+    """
+    Compte les colonnes d'une ligne de données
+    
+    Les virgules et blancs en fin de ligne ne comptent pas : les exports HMI terminent
+    chaque ligne par une virgule.
+    
+    Args:
+        line: Ligne de données brute
+    
+    Returns:
+        Nombre de champs jusqu'au dernier champ non vide (commentaire % exclu)
+    """
+    content = line.split(b'%', 1)[0].rstrip(b', \t\r\n')
+    return content.count(b',') + 1 if content else 0
+
+
+def _scan_row_widths(file_path: str, data_offset: int) -> Tuple[int, int]:
+    """
+    Mesure la ligne de données la plus longue
+    
+    Args:
+        file_path: Chemin vers le fichier CSV
+        data_offset: Position en octets de la première ligne de données
+    
+    Returns:
+        Tuple contenant (nombre de colonnes au sens de _row_width, nombre de champs bruts)
+    """
+    if njit is not None:
+        _, n_columns, n_fields = _scan_rows(_map_bytes(file_path), data_offset)
+        return n_columns, n_fields
+    
+    n_columns = n_fields = 0
+    with open(file_path, 'rb') as file:
+        file.seek(data_offset)
+        for line in file:
+            content = line.split(b'%', 1)[0]
+            if content.strip():
+                n_columns = max(n_columns, _row_width(content))
+                n_fields = max(n_fields, content.count(b',') + 1)
+    return n_columns, n_fields
+
+
+def _read_columns_tolerant(file_path: str, data_offset: int) -> np.ndarray:
+    """
+    Lit toutes les colonnes en convertissant les cellules mal formées en NaN
     
-    # Trouve le début des données (après les lignes %)
-    data_start = 0
-    for i, line in enumerate(lines):
-        if not line.startswith('%') and line.strip():
-            data_start = i
-            break
+    Repli des lecteurs typés (pyarrow, pandas) qui rejettent tout le fichier à la
+    première cellule non numérique. Avec Numba, les octets du fichier mappé en mémoire
+    sont découpés et convertis par un noyau compilé ; sinon la conversion est faite
+    colonne par colonne par pd.to_numeric (boucle C) au lieu d'un float() par cellule.
+    La largeur est celle de la ligne la plus longue (_row_width) ; les cellules absentes
+    des lignes plus courtes valent NaN.
     
-    times = []
-    values = []
+    Args:
+        file_path: Chemin vers le fichier CSV
+        data_offset: Position en octets de la première ligne de données
+    
+    Returns:
+        Matrice (N, colonnes) des valeurs brutes, en ordre Fortran
+    """
+    if njit is not None:
+        buf = _map_bytes(file_path)
+        data, deferred = _parse_csv_bytes(buf, data_offset)
+        # Champs hors des chemins rapides de _parse_float (exposant au-delà de 22, valeur
+        # proche d'un milieu entre deux float32) : float() de Python, correctement arrondi,
+        # infini au-delà du plus grand float32
+        with np.errstate(over='ignore'):
+            for row, col, start, end in deferred:
+                data[row, col] = float(buf[start:end].tobytes())
+        return data
+    
+    # Lecture en texte brut, sans recherche de valeurs manquantes : pd.to_numeric
+    # convertit de toute façon les cellules vides ou invalides en NaN. Les noms couvrent
+    # la ligne la plus longue : aucune ligne n'est rejetée et les champs manquants sont
+    # lus vides, comme par le noyau Numba
+    n_columns, n_fields = _scan_row_widths(file_path, data_offset)
+    df = pd.read_csv(file_path, comment='%', header=None, sep=',', skipinitialspace=True,
+                     names=range(n_fields), usecols=range(n_columns), dtype=str, engine='c',
+                     low_memory=False, na_filter=False)
+    
+    data = np.empty((len(df), n_columns), dtype=DATA_DTYPE, order='F')
+    for i in range(n_columns):
+        # Chaque colonne de chaînes est libérée dès sa conversion (pic mémoire réduit)
+        data[:, i] = pd.to_numeric(df.pop(i), errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return data
+
+
+if njit is not None:
+    # Littéral infini en minuscules ; 'inf' en est le préfixe (même casse que pd.to_numeric)
+    _INFINITY = np.frombuffer(b'infinity', dtype=np.uint8)
+    # Puissances de dix exactes en float64
+    _POW10 = np.array([10.0 ** k for k in range(23)])
+
+    @njit(cache=True)
+    def _parse_float(buf, start, end):
+        """
+        Convertit buf[start:end] en flottant ; NaN si le champ n'est pas un nombre
+        
+        Même résultat que float() converti en DATA_DTYPE (float32). Chemin exact :
+        mantisse entière d'au plus 2**53 et puissance de dix d'au plus 10**22, toutes deux
+        représentables, donc une seule opération arrondie. Au-delà, la mantisse est
+        tronquée à 18 chiffres : l'arrondi en float32 reste sûr hors du voisinage d'un
+        milieu entre deux float32. Le second élément du résultat est False sinon (exposant
+        trop grand, valeur ambiguë) : la valeur est alors à reprendre par float().
+        """
+        while start < end and (buf[start] == 32 or buf[start] == 9):
+            start += 1
+        while end > start and (buf[end - 1] == 32 or buf[end - 1] == 9 or buf[end - 1] == 13):
+            end -= 1
+        i = start
+        negative = False
+        if i < end and (buf[i] == 43 or buf[i] == 45):  # '+' / '-'
+            negative = buf[i] == 45
+            i += 1
+        if i < end and (buf[i] | 32) == 105:  # 'i' : inf / infinity, sans distinction de casse
+            length = end - i
+            if length != 3 and length != 8:
+                return np.nan, True
+            for k in range(length):
+                if (buf[i + k] | 32) != _INFINITY[k]:
+                    return np.nan, True
+            return (-np.inf if negative else np.inf), True
+        # Mantisse entière sans ses zéros de tête ; les zéros suivants ne sont multipliés
+        # qu'à l'arrivée d'un chiffre non nul (les zéros finaux des exports ne comptent pas).
+        # Au-delà de 18 chiffres (limite int64), les chiffres suivants sont tronqués
+        mantissa = 0
+        n_significant = 0
+        pending_zeros = 0
+        truncated = False
+        n_digits = 0
+        scale = 0
+        fraction = False
+        while i < end:
+            digit = buf[i] - 48
+            if 0 <= digit <= 9:
+                n_digits += 1
+                if fraction:
+                    scale -= 1
+                if digit == 0:
+                    if n_significant > 0:
+                        pending_zeros += 1
+                elif not truncated and n_significant + pending_zeros < 18:
+                    for _ in range(pending_zeros):
+                        mantissa *= 10
+                    mantissa = mantissa * 10 + digit
+                    n_significant += pending_zeros + 1
+                    pending_zeros = 0
+                else:
+                    # Chiffres écartés : chacun vaut un facteur 10 sur la mantisse gardée
+                    truncated = True
+                    scale += pending_zeros + 1
+                    pending_zeros = 0
+            elif buf[i] == 46 and not fraction:  # '.'
+                fraction = True
+            else:
+                break
+            i += 1
+        if n_digits == 0:
+            return np.nan, True
+        scale += pending_zeros
+        if i < end and (buf[i] == 101 or buf[i] == 69):  # 'e' / 'E'
+            i += 1
+            exp_negative = False
+            if i < end and (buf[i] == 43 or buf[i] == 45):
+                exp_negative = buf[i] == 45
+                i += 1
+            exponent = 0
+            exp_digits = 0
+            while i < end and 48 <= buf[i] <= 57:
+                if exponent < 100000:
+                    exponent = exponent * 10 + (buf[i] - 48)
+                exp_digits += 1
+                i += 1
+            if exp_digits == 0:
+                return np.nan, True
+            scale += -exponent if exp_negative else exponent
+        if i != end:
+            return np.nan, True
+        if mantissa == 0:
+            return (-0.0 if negative else 0.0), True
+        if not -22 <= scale <= 22:
+            return np.nan, False
+        value = mantissa / _POW10[-scale] if scale < 0 else mantissa * _POW10[scale]
+        if truncated or mantissa > 2 ** 53:
+            # Mantisse tronquée ou arrondie en float64 : quelques ulp d'erreur au plus, sans
+            # effet sur l'arrondi en DATA_DTYPE loin d'un milieu entre deux valeurs voisines
+            if not 1.2e-38 < value < 3.4e38:
+                return np.nan, False
+            single = DATA_DTYPE(value)
+            below = (np.float64(single) + np.float64(np.nextafter(single, DATA_DTYPE(0.0)))) / 2.0
+            above = (np.float64(single) + np.float64(np.nextafter(single, DATA_DTYPE(np.inf)))) / 2.0
+            margin = value * 2.0 ** -50
+            if value - below <= margin or above - value <= margin:
+                return np.nan, False
+        return (-value if negative else value), True
+
+    @njit(cache=True)
+    def _scan_rows(buf, start):
+        """Borne du nombre de lignes de buf[start:], plus grandes largeurs (_row_width) et nombre de champs"""
+        size = buf.shape[0]
+        max_rows = 1
+        n_columns = 0
+        n_fields = 0
+        commas = 0
+        width = 0  # champs jusqu'au dernier octet significatif de la ligne
+        blank = True
+        in_comment = False
+        for i in range(start, size + 1):
+            byte = buf[i] if i < size else 10
+            if byte == 10:
+                if i < size:
+                    max_rows += 1
+                if not blank:
+                    n_columns = max(n_columns, width)
+                    n_fields = max(n_fields, commas + 1)
+                commas = 0
+                width = 0
+                blank = True
+                in_comment = False
+            elif in_comment:
+                continue
+            elif byte == 37:  # '%'
+                in_comment = True
+            elif byte == 44:  # ','
+                commas += 1
+                blank = False
+            elif byte != 32 and byte != 9 and byte != 13:
+                width = commas + 1
+                blank = False
+        return max_rows, n_columns, n_fields
+
+    @njit(cache=True)
+    def _parse_csv_bytes(buf, start):
+        """
+        Découpe les lignes de buf[start:] en colonnes (ligne la plus longue) ; '%' ouvre un commentaire
+        
+        Retourne aussi (ligne, colonne, début, fin) de chaque champ hors du chemin rapide
+        exact de _parse_float, à convertir hors du noyau.
+        """
+        size = buf.shape[0]
+        max_rows, n_columns, _ = _scan_rows(buf, start)
+        # Buffer non initialisé, borné par le nombre de lignes : seules les cellules
+        # absentes des lignes courtes reçoivent NaN explicitement
+        out = np.empty((n_columns, max_rows), dtype=DATA_DTYPE)
+        # Liste vide typée de (ligne, colonne, début, fin) : pas de tableau réalloué dans la boucle
+        deferred = [(0, 0, 0, 0) for _ in range(0)]
+        row = 0
+        pos = start
+        while pos < size:
+            line_end = pos
+            content_end = -1
+            while line_end < size and buf[line_end] != 10:
+                if content_end < 0 and buf[line_end] == 37:  # '%'
+                    content_end = line_end
+                line_end += 1
+            if content_end < 0:
+                content_end = line_end
+            blank = True
+            for i in range(pos, content_end):
+                if buf[i] != 32 and buf[i] != 9 and buf[i] != 13:
+                    blank = False
+                    break
+            if not blank:
+                col = 0
+                field_start = pos
+                for i in range(pos, content_end + 1):
+                    if i == content_end or buf[i] == 44:  # ','
+                        if col < n_columns:
+                            value, exact = _parse_float(buf, field_start, i)
+                            out[col, row] = value
+                            if not exact:
+                                deferred.append((row, col, field_start, i))
+                        col += 1
+                        field_start = i + 1
+                for c in range(col, n_columns):
+                    out[c, row] = np.nan
+                row += 1
+            pos = line_end + 1
+        return out[:, :row].T, deferred
+
+
+def _estimate_row_count(file_path: str, row_bytes: int) -> int:
+    """
+    Estime le nombre de lignes de données d'après la taille du fichier
+    
+    Les exports HMI ont des lignes de longueur quasi fixe : la taille du fichier divisée
+    par celle de la première ligne de données donne une borne proche du compte réel.
     
-    for line in lines[data_start:]:
-        if line.strip():
-            row_values = [x.strip() for x in line.split(',') if x.strip()]
-            if len(row_values) >= min_columns:
-                try:
-                    time_val = float(row_values[0]) / 60  # Temps en minutes
-                    data_val = float(row_values[column_index])
-                    times.append(time_val)
-                    values.append(data_val)
-                except ValueError:
-                    continue
+    Args:
+        file_path: Chemin vers le fichier CSV
+        row_bytes: Taille en octets de la première ligne de données
     
-    return np.array(times), np.array(values)
+    Returns:
+        Nombre de lignes estimé (au moins 1024)
+    """
+    return max(1024, os.path.getsize(file_path) // max(row_bytes, 1) + 1)
+
+
+if njit is not None:
+    # Seules la réassociation (réduction vectorisée) et la contraction (FMA) sont permises :
+    # les données peuvent contenir des infinis, fastmath=True supposerait le contraire
+    @njit(parallel=True, fastmath={'reassoc', 'contract'}, cache=True)
+    def _stats_kernel(data, shift):
+        """Réduction parallèle en une passe : (somme et somme des carrés de data - shift, min, max, nb == 100)"""
+        total = 0.0
+        sum_sq = 0.0
+        minimum = np.inf
+        maximum = -np.inf
+        count_100 = 0
+        for i in prange(data.shape[0]):
+            v = np.float64(data[i])
+            d = v - shift
+            total += d
+            sum_sq += d * d
+            minimum = min(minimum, v)
+            maximum = max(maximum, v)
+            if v == 100.0:
+                count_100 += 1
+        return total, sum_sq, minimum, maximum, count_100
+else:
+    # Taille des blocs de la réduction NumPy (128 Kio en float32, tient en cache L2)
+    _STATS_BLOCK = 1 << 15
+
+    def _stats_kernel(data, shift):
+        """Équivalent NumPy de la réduction Numba, par blocs restant en cache L2"""
+        total = 0.0
+        sum_sq = 0.0
+        minimum = np.inf
+        maximum = -np.inf
+        count_100 = 0
+        shifted = np.empty(min(data.size, _STATS_BLOCK), dtype=np.float64)
+        # Les cinq réductions relisent chaque bloc alors qu'il est encore en cache :
+        # le tableau ne transite qu'une fois depuis la mémoire principale
+        for start in range(0, data.size, _STATS_BLOCK):
+            block = data[start:start + _STATS_BLOCK]
+            d = np.subtract(block, shift, out=shifted[:block.size])
+            total += d.sum()
+            sum_sq += np.dot(d, d)
+            minimum = min(minimum, block.min())
+            maximum = max(maximum, block.max())
+            count_100 += np.count_nonzero(block == 100)
+        return total, sum_sq, minimum, maximum, count_100
+
+
+def _fast_stats(data: np.ndarray, is_percentage: bool = False) -> Dict[str, float]:
+    """
+    Calcule les statistiques descriptives d'un tableau en limitant les passes mémoire
+    
+    La moyenne et l'écart-type sont dérivés de la somme et de la somme des carrés
+    renvoyées par _stats_kernel (une seule passe parallèle si Numba est installé).
+    Les sommes portent sur les écarts au premier élément : pour un signal de grande
+    moyenne et de faible dispersion, E[x²] - E[x]² ne perd alors pas ses chiffres
+    significatifs.
+    
+    Args:
+        data: Données à résumer
+        is_percentage: True si les données sont des pourcentages
+    
+    Returns:
+        Dictionnaire des statistiques (Moyenne, Médiane, Écart-type, Minimum, Maximum,
+        Plage, puis Temps à 100% ou CV (%))
+    """
+    n = data.size
+    if n == 0:
+        raise ValueError("Aucune donnée à analyser")
+    
+    shift = float(data[0])
+    if not np.isfinite(shift):
+        shift = 0.0  # un décalage infini rendrait toutes les sommes NaN
+    total, sum_sq, minimum, maximum, count_100 = _stats_kernel(data, shift)
+    mean_shifted = total / n
+    mean = shift + mean_shifted
+    std = np.sqrt(max(sum_sq / n - mean_shifted * mean_shifted, 0.0))
+    
+    stats = {
+        'Moyenne': mean,
+        'Médiane': np.median(data),
+        'Écart-type': std,
+        'Minimum': minimum,
+        'Maximum': maximum,
+        'Plage': maximum - minimum
+    }
+    
+    if is_percentage:
+        stats['Temps à 100%'] = count_100 * (100.0 / n)
+    else:
+        stats['CV (%)'] = std / mean * 100
+    
+    return stats
 
 
 def calculate_statistics(data_avant: np.ndarray, data_apres: np.ndarray, 
@@ -82,32 +756,53 @@ def calculate_statistics(data_avant: np.ndarray, data_apres: np.ndarray,
     Returns:
         Tuple contenant (stats_avant, stats_apres) - dictionnaires des statistiques
     """
-    stats_avant = {
-        'Moyenne': np.mean(data_avant),
-        'Médiane': np.median(data_avant), 
-        'Écart-type': np.std(data_avant),
-        'Minimum': np.min(data_avant),
-        'Maximum': np.max(data_avant),
-        'Plage': np.max(data_avant) - np.min(data_avant)
-    }
+    stats_avant = _fast_stats(data_avant, is_percentage)
+    stats_apres = _fast_stats(data_apres, is_percentage)
     
-    stats_apres = {
-        'Moyenne': np.mean(data_apres),
-        'Médiane': np.median(data_apres),
-        'Écart-type': np.std(data_apres), 
-        'Minimum': np.min(data_apres),
-        'Maximum': np.max(data_apres),
-        'Plage': np.max(data_apres) - np.min(data_apres)
-    }
+    return stats_avant, stats_apres
+
+
+def column_statistics(file_path: str, column_index: int, min_columns: int = 2,
+                      is_percentage: bool = False) -> Dict[str, float]:
+    """
+    Statistiques d'une colonne d'un fichier CSV, calculées une seule fois par fichier et colonne
     
-    if is_percentage:
-        stats_avant['Temps à 100%'] = np.sum(data_avant == 100) / len(data_avant) * 100
-        stats_apres['Temps à 100%'] = np.sum(data_apres == 100) / len(data_apres) * 100
-    else:
-        stats_avant['CV (%)'] = (np.std(data_avant) / np.mean(data_avant)) * 100
-        stats_apres['CV (%)'] = (np.std(data_apres) / np.mean(data_apres)) * 100
+    Comme pour extract_thickness_data, le résultat reste en cache tant que le fichier
+    n'est pas modifié ; une copie du dictionnaire est retournée.
     
-    return stats_avant, stats_apres
+    Args:
+        file_path: Chemin vers le fichier CSV
+        column_index: Index de la colonne (-1 pour la dernière)
+        min_columns: Nombre minimum de colonnes requis
+        is_percentage: True si les données sont des pourcentages
+    
+    Returns:
+        Dictionnaire des statistiques (voir calculate_statistics)
+    """
+    key = _cache_key(file_path)
+    # Index résolu avant la clé de cache : -1 et la dernière colonne partagent une entrée
+    col = _resolve_column(file_path, _load_thickness_file_cached(*key)[0].shape[1],
+                          column_index, min_columns)
+    return dict(_column_statistics_cached(*key, col, is_percentage))
+
+
+@functools.lru_cache(maxsize=FILE_CACHE_SIZE * 8)
+def _column_statistics_cached(file_path: str, mtime: float, col: int,
+                              is_percentage: bool) -> Dict[str, float]:
+    """
+    Calcul effectif de column_statistics, mémoïsé sur (chemin absolu, mtime, colonne)
+    
+    Args:
+        file_path: Chemin absolu vers le fichier CSV
+        mtime: Date de modification du fichier (clé d'invalidation)
+        col: Index de colonne positif, déjà validé
+        is_percentage: True si les données sont des pourcentages
+    
+    Returns:
+        Dictionnaire des statistiques
+    """
+    _, values = _column_views(_load_thickness_file_cached(file_path, mtime), col)
+    return _fast_stats(values, is_percentage)
 
 
 def print_statistics(stats_avant: Dict[str, float], stats_apres: Dict[str, float], 
@@ -140,9 +835,96 @@ def print_statistics(stats_avant: Dict[str, float], stats_apres: Dict[str, float
             print(f"{metric:<20} {avant:<12.3f} {apres:<12.3f} {diff:<+12.3f}")
 
 
+def _get_figure(name: str, nrows: int, ncols: int,
+                figsize: Tuple[float, float]) -> Tuple[plt.Figure, np.ndarray]:
+    """
+    Retourne une figure réutilisable, axes vidés, plutôt que d'en recréer une à chaque appel
+    
+    Une figure fermée entre-temps (fenêtre fermée, affichage inline) est recréée.
+    
+    Args:
+        name: Identifiant de la figure dans le cache
+        nrows: Nombre de lignes de sous-graphiques
+        ncols: Nombre de colonnes de sous-graphiques
+        figsize: Taille de la figure en pouces
+    
+    Returns:
+        Tuple contenant (fig, axes) - axes sous forme d'array numpy
+    """
+    cached = _FIGURES.get(name)
+    if cached is not None and plt.fignum_exists(cached[0].number):
+        fig, axes = cached
+        for ax in axes.flat:
+            ax.cla()
+        plt.figure(fig.number)
+        return fig, axes
+    
+    # Mise en page contrainte : recalculée au rendu, suptitle compris (pas de tight_layout)
+    fig, axes = plt.subplots(nrows, ncols, figsize=figsize, squeeze=False, layout='constrained')
+    _FIGURES[name] = (fig, axes)
+    return fig, axes
+
+
+def _show_figure(fig: plt.Figure, name: str) -> None:
+    """
+    Affiche la figure, ou l'enregistre dans FIGURES_DIR en mode sans affichage
+    
+    La figure n'est pas fermée : elle reste dans le cache de _get_figure et sera
+    réutilisée par l'analyse suivante, la mémoire reste donc bornée.
+    
+    Args:
+        fig: Figure à afficher
+        name: Nom du fichier PNG (sans extension) en mode sans affichage
+    """
+    if HEADLESS:
+        os.makedirs(FIGURES_DIR, exist_ok=True)
+        file_name = re.sub(r'[^\w-]+', '_', name).strip('_') + '.png'
+        fig.savefig(os.path.join(FIGURES_DIR, file_name), dpi=100)
+    else:
+        plt.show()
+
+
+def _rolling_mean(data: np.ndarray, window: int) -> np.ndarray:
+    """
+    Moyenne sur fenêtre glissante en O(n) par différence de sommes cumulées
+    
+    Args:
+        data: Données d'entrée
+        window: Taille de la fenêtre
+    
+    Returns:
+        Array des moyennes, de longueur len(data) - window + 1
+    """
+    cumsum = np.concatenate(([0.0], np.cumsum(data, dtype=np.float64)))
+    return (cumsum[window:] - cumsum[:-window]) / window
+
+
+def _rolling_std(data: np.ndarray, window: int) -> np.ndarray:
+    """
+    Écart-type sur fenêtre glissante en O(n) : Var = E[x²] - E[x]²
+    
+    Les données sont centrées sur leur moyenne globale (la variance est invariante par
+    translation) : les sommes cumulées restent petites et la soustraction des deux
+    moyennes glissantes ne perd pas de chiffres significatifs.
+    
+    Args:
+        data: Données d'entrée
+        window: Taille de la fenêtre
+    
+    Returns:
+        Array des écarts-types, de longueur len(data) - window + 1
+    """
+    centered = data - data.mean(dtype=np.float64)
+    mean = _rolling_mean(centered, window)
+    mean_sq = _rolling_mean(np.square(centered), window)
+    return np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+
+
 def create_comparative_plots(times_avant: np.ndarray, data_avant: np.ndarray, 
                            times_apres: np.ndarray, data_apres: np.ndarray, 
-                           title: str, ylabel: str, is_percentage: bool = False) -> None:
+                           title: str, ylabel: str, is_percentage: bool = False,
+                           stats_avant: Optional[Dict[str, float]] = None,
+                           stats_apres: Optional[Dict[str, float]] = None) -> None:
     """
     Crée les graphiques comparatifs pour deux jeux de données (reproduction exacte du code original)
     
@@ -154,26 +936,34 @@ def create_comparative_plots(times_avant: np.ndarray, data_avant: np.ndarray,
         title: Titre principal des graphiques
         ylabel: Label de l'axe Y
         is_percentage: True si les données sont des pourcentages
+        stats_avant: Statistiques avant optimisation (recalculées si absentes)
+        stats_apres: Statistiques après optimisation (recalculées si absentes)
     """
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 10))
+    if stats_avant is None or stats_apres is None:
+        stats_avant, stats_apres = calculate_statistics(data_avant, data_apres, is_percentage)
+    # Moyennes lues une fois et partagées par tous les sous-graphiques
+    mean_avant = stats_avant['Moyenne']
+    mean_apres = stats_apres['Moyenne']
+    
+    fig, ((ax1, ax2), (ax3, ax4)) = _get_figure('comparative', 2, 2, figsize=(16, 10))
     
     # 1. Évolution temporelle
-    ax1.plot(times_avant, data_avant, 'r-', label='Avant optimisation', linewidth=1.5, alpha=0.8)
-    ax1.plot(times_apres, data_apres, 'g-', label='Après optimisation', linewidth=1.5, alpha=0.8)
+    ax1.plot(times_avant, data_avant, 'r-', label='Avant optimisation', **_LINE_KW)
+    ax1.plot(times_apres, data_apres, 'g-', label='Après optimisation', **_LINE_KW)
     
     if is_percentage:
         # Pour les pourcentages - lignes de référence spéciales
-        ax1.axhline(y=100, color='blue', linestyle='--', alpha=0.6, label='Optimal (100%)')
-        ax1.axhline(y=75, color='red', linestyle='--', alpha=0.6, label='critical (75%)')
+        ax1.axhline(y=100, color='blue', label='Optimal (100%)', **_REF_LINE_KW)
+        ax1.axhline(y=75, color='red', label='critical (75%)', **_REF_LINE_KW)
         ax1.set_ylim(0, 105)
     else:
-        # Pour les capteurs - lignes de moyennes
-        ax1.axhline(y=np.mean(data_avant), color='red', linestyle='--', alpha=0.6, 
-                   label=f'Moy. Avant: {np.mean(data_avant):.2f}')
-        ax1.axhline(y=np.mean(data_apres), color='green', linestyle='--', alpha=0.6,
-                   label=f'Moy. Après: {np.mean(data_apres):.2f}')
+        # Pour les capteurs - lignes de moyennes (issues des statistiques)
+        ax1.axhline(y=mean_avant, color='red', 
+                   label=f'Moy. Avant: {mean_avant:.2f}', **_REF_LINE_KW)
+        ax1.axhline(y=mean_apres, color='green',
+                   label=f'Moy. Après: {mean_apres:.2f}', **_REF_LINE_KW)
     
-    ax1.set_title(f'Évolution {title}', fontweight='bold', fontsize=12)
+    ax1.set_title(f'Évolution {title}', **_TITLE_KW)
     ax1.set_xlabel('Temps (minutes)')
     ax1.set_ylabel(ylabel)
     ax1.legend()
@@ -181,18 +971,19 @@ def create_comparative_plots(times_avant: np.ndarray, data_avant: np.ndarray,
     
     # 2. Histogrammes comparatifs
     if is_percentage:
-        bins = np.linspace(0, 100, 21)
+        bins = _PCT_BINS
         hist_title = 'Distribution des Pourcentages'
     else:
-        bins = np.linspace(min(np.min(data_avant), np.min(data_apres)), 
-                          max(np.max(data_avant), np.max(data_apres)), 25)
+        # Bornes communes issues des statistiques : aucune passe min/max supplémentaire
+        bins = np.linspace(min(stats_avant['Minimum'], stats_apres['Minimum']), 
+                          max(stats_avant['Maximum'], stats_apres['Maximum']), 25)
         hist_title = f'Distribution des % de bouteilles lues ({title.split("(")[-1].replace(")", "")})'
     
-    ax2.hist(data_avant, bins=bins, alpha=0.6, color='red', label='Avant', density=True)
-    ax2.hist(data_apres, bins=bins, alpha=0.6, color='green', label='Après', density=True)
-    ax2.axvline(np.mean(data_avant), color='red', linestyle='--', linewidth=2)
-    ax2.axvline(np.mean(data_apres), color='green', linestyle='--', linewidth=2)
-    ax2.set_title(hist_title, fontweight='bold', fontsize=12)
+    ax2.hist(data_avant, bins=bins, color='red', label='Avant', **_HIST_KW)
+    ax2.hist(data_apres, bins=bins, color='green', label='Après', **_HIST_KW)
+    ax2.axvline(mean_avant, color='red', linestyle='--', linewidth=2)
+    ax2.axvline(mean_apres, color='green', linestyle='--', linewidth=2)
+    ax2.set_title(hist_title, **_TITLE_KW)
     
     if is_percentage:
         ax2.set_xlabel('Pourcentage de bouteilles lues (%)')
@@ -214,11 +1005,8 @@ def create_comparative_plots(times_avant: np.ndarray, data_avant: np.ndarray,
     bp['boxes'][1].set_alpha(0.6)
     
     # Ajout des valeurs des quartiles sur le graphique (comme dans l'original)
-    for i, data in enumerate(box_data):
-        q1 = np.percentile(data, 25)
-        q2 = np.percentile(data, 50)  # médiane
-        q3 = np.percentile(data, 75)
-        mean_val = np.mean(data)
+    for i, (data, mean_val) in enumerate(zip(box_data, (mean_avant, mean_apres))):
+        q1, q2, q3 = np.percentile(data, [25, 50, 75])  # un seul tri partiel ; q2 = médiane
         
         # Position x pour les annotations
         x_pos = i + 1
@@ -229,15 +1017,15 @@ def create_comparative_plots(times_avant: np.ndarray, data_avant: np.ndarray,
             ax3.text(x_pos + 0.15, q2, f'Med: {q2:.1f}%', fontsize=9, va='center', ha='left', fontweight='bold')
             ax3.text(x_pos + 0.15, q3, f'Q3: {q3:.1f}%', fontsize=9, va='center', ha='left')
             ax3.text(x_pos + 0.15, mean_val, f'Moy: {mean_val:.1f}%', fontsize=9, va='center', ha='left', 
-                     bbox=dict(boxstyle="round,pad=0.2", facecolor="yellow", alpha=0.7))
+                     bbox=_MEAN_LABEL_BBOX)
         else:
             ax3.text(x_pos + 0.15, q1, f'Q1: {q1:.3f}', fontsize=9, va='center', ha='left')
             ax3.text(x_pos + 0.15, q2, f'Med: {q2:.3f}', fontsize=9, va='center', ha='left', fontweight='bold')
             ax3.text(x_pos + 0.15, q3, f'Q3: {q3:.3f}', fontsize=9, va='center', ha='left')
             ax3.text(x_pos + 0.15, mean_val, f'Moy: {mean_val:.3f}', fontsize=9, va='center', ha='left', 
-                     bbox=dict(boxstyle="round,pad=0.2", facecolor="yellow", alpha=0.7))
+                     bbox=_MEAN_LABEL_BBOX)
     
-    ax3.set_title('Comparaison des Distributions', fontweight='bold', fontsize=12)
+    ax3.set_title('Comparaison des Distributions', **_TITLE_KW)
     if is_percentage:
         ax3.set_ylabel('Pourcentage (%)')
     else:
@@ -247,19 +1035,12 @@ def create_comparative_plots(times_avant: np.ndarray, data_avant: np.ndarray,
     # 4. Graphique spécialisé selon le type
     if is_percentage:
         # Pour les pourcentages: Barres comparatives par catégories (comme dans l'original)
-        categories = ['0-65%', '65-70%', '70-75%', '75-80%', '80-85%', '85-90%', '90-95%', '95-100%']
+        categories = _PCT_CATEGORIES
         
         def calc_time_in_categories(data):
-            return [
-                np.sum(data < 65) / len(data) * 100,
-                np.sum((data >= 65) & (data < 70)) / len(data) * 100,
-                np.sum((data >= 70) & (data < 75)) / len(data) * 100,
-                np.sum((data >= 75) & (data < 80)) / len(data) * 100,
-                np.sum((data >= 80) & (data < 85)) / len(data) * 100,
-                np.sum((data >= 85) & (data < 90)) / len(data) * 100,
-                np.sum((data >= 90) & (data < 95)) / len(data) * 100,
-                np.sum(data >= 95) / len(data) * 100  # 95-100% (inclut 100%)
-            ]
+            # Un seul histogramme au lieu de huit masques booléens
+            counts, _ = np.histogram(data, bins=_PCT_CATEGORY_EDGES)
+            return counts * (100.0 / len(data))
         
         time_avant_cat = calc_time_in_categories(data_avant)
         time_apres_cat = calc_time_in_categories(data_apres)
@@ -270,7 +1051,7 @@ def create_comparative_plots(times_avant: np.ndarray, data_avant: np.ndarray,
         bars1 = ax4.bar(x - width/2, time_avant_cat, width, label='Avant', color='red', alpha=0.7)
         bars2 = ax4.bar(x + width/2, time_apres_cat, width, label='Après', color='green', alpha=0.7)
         
-        ax4.set_title('Temps Passé par Catégorie (5% incréments)', fontweight='bold', fontsize=12)
+        ax4.set_title('Temps Passé par Catégorie (5% incréments)', **_TITLE_KW)
         ax4.set_xlabel('Catégories de Pourcentage')
         ax4.set_ylabel('Temps (%)')
         ax4.set_xticks(x)
@@ -278,39 +1059,31 @@ def create_comparative_plots(times_avant: np.ndarray, data_avant: np.ndarray,
         ax4.legend()
         ax4.grid(True, alpha=0.3)
         
-        # Ajout des valeurs sur les barres
-        for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax4.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                        f'{height:.1f}%', ha='center', va='bottom', fontsize=9)
+        # Ajout des valeurs sur les barres (un appel par série)
+        for bars in (bars1, bars2):
+            ax4.bar_label(bars, fmt='%.1f%%', padding=3, fontsize=9)
     else:
         # Pour les capteurs: Analyse de la variabilité dans le temps (comme dans l'original)
         window_size = max(10, len(data_avant) // 50)  # Fenêtre adaptative
         
-        def rolling_std(data, window):
-            """Calcule l'écart-type sur fenêtre glissante"""
-            rolling_stds = []
-            for i in range(len(data) - window + 1):
-                rolling_stds.append(np.std(data[i:i+window]))
-            return np.array(rolling_stds)
-        
         if len(data_avant) > window_size and len(data_apres) > window_size:
-            std_avant = rolling_std(data_avant, window_size)
-            std_apres = rolling_std(data_apres, window_size)
+            std_avant = _rolling_std(data_avant, window_size)
+            std_apres = _rolling_std(data_apres, window_size)
             
             time_window_avant = times_avant[window_size-1:]
             time_window_apres = times_apres[window_size-1:]
             
-            ax4.plot(time_window_avant, std_avant, 'r-', label='Stabilité Avant', linewidth=1.5, alpha=0.8)
-            ax4.plot(time_window_apres, std_apres, 'g-', label='Stabilité Après', linewidth=1.5, alpha=0.8)
+            ax4.plot(time_window_avant, std_avant, 'r-', label='Stabilité Avant', **_LINE_KW)
+            ax4.plot(time_window_apres, std_apres, 'g-', label='Stabilité Après', **_LINE_KW)
             
-            ax4.axhline(y=np.mean(std_avant), color='red', linestyle='--', alpha=0.6,
-                       label=f'Moy. Stab. Avant: {np.mean(std_avant):.4f}')
-            ax4.axhline(y=np.mean(std_apres), color='green', linestyle='--', alpha=0.6,
-                       label=f'Moy. Stab. Après: {np.mean(std_apres):.4f}')
+            std_mean_avant = std_avant.mean()
+            std_mean_apres = std_apres.mean()
+            ax4.axhline(y=std_mean_avant, color='red',
+                       label=f'Moy. Stab. Avant: {std_mean_avant:.4f}', **_REF_LINE_KW)
+            ax4.axhline(y=std_mean_apres, color='green',
+                       label=f'Moy. Stab. Après: {std_mean_apres:.4f}', **_REF_LINE_KW)
             
-            ax4.set_title(f'Stabilité dans le Temps (fenêtre {window_size} pts, ou 2%)', fontweight='bold', fontsize=12)
+            ax4.set_title(f'Stabilité dans le Temps (fenêtre {window_size} pts, ou 2%)', **_TITLE_KW)
             ax4.set_xlabel('Temps (minutes)')
             ax4.set_ylabel('Écart-type local')
             ax4.legend()
@@ -321,9 +1094,8 @@ def create_comparative_plots(times_avant: np.ndarray, data_avant: np.ndarray,
         
         ax4.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.suptitle(f'ANALYSE COMPARATIVE - {title}', fontsize=16, fontweight='bold', y=1.02)
-    plt.show()
+    fig.suptitle(f'ANALYSE COMPARATIVE - {title}', fontsize=16, fontweight='bold')
+    _show_figure(fig, f'comparatif_{title}')
 
 
 def analyze_thickness_data(csv_file_1: str, csv_file_2: str, column_index: int, 
@@ -353,18 +1125,21 @@ def analyze_thickness_data(csv_file_1: str, csv_file_2: str, column_index: int,
     print(f"✅ Avant: {len(data_avant)} points sur {times_avant.max():.1f} min")
     print(f"✅ Après: {len(data_apres)} points sur {times_apres.max():.1f} min")
     
-    # Calcul des statistiques
-    stats_avant, stats_apres = calculate_statistics(data_avant, data_apres, is_percentage)
+    # Calcul des statistiques (une seule fois par fichier et colonne)
+    stats_avant = column_statistics(csv_file_1, column_index, min_columns, is_percentage)
+    stats_apres = column_statistics(csv_file_2, column_index, min_columns, is_percentage)
     
     # Affichage des statistiques
     print_statistics(stats_avant, stats_apres, title, is_percentage)
     
     # Création des graphiques
     print(f"\n📈 Création des graphiques pour {title}...")
-    create_comparative_plots(times_avant, data_avant, times_apres, data_apres, title, ylabel, is_percentage)
+    create_comparative_plots(times_avant, data_avant, times_apres, data_apres, title, ylabel, is_percentage,
+                             stats_avant, stats_apres)
     
     return {
         'title': title,
+        'is_percentage': is_percentage,
         'stats_avant': stats_avant,
         'stats_apres': stats_apres,
         'data_avant': data_avant,
@@ -374,74 +1149,79 @@ def analyze_thickness_data(csv_file_1: str, csv_file_2: str, column_index: int,
     }
 
 
-def create_summary_analysis(csv_file_1: str, csv_file_2: str, analyses_config: List[Dict]) -> List[Dict]:
+def create_summary_analysis(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Crée une analyse résumée de toutes les métriques
     
+    Les statistiques déjà calculées par analyze_thickness_data sont réutilisées :
+    aucun fichier n'est relu.
+    
     Args:
-        csv_file_1: Chemin vers le premier fichier CSV
-        csv_file_2: Chemin vers le deuxième fichier CSV
-        analyses_config: Configuration des analyses à effectuer
+        results: Résultats retournés par analyze_thickness_data, un par métrique
     
     Returns:
-        Liste des résultats résumés
+        Dictionnaire de colonnes (une entrée par métrique) : 'metric' et 'improvement'
+        sont des listes, les valeurs numériques des arrays numpy
     """
     print("\n📊 RÉSUMÉ COMPARATIF DE TOUTES LES MÉTRIQUES")
     print("=" * 80)
     
-    summary_data = []
+    n_metrics = len(results)
+    metric_names = []
+    improvements = []
+    mean_before = np.empty(n_metrics)
+    mean_after = np.empty(n_metrics)
+    std_before = np.empty(n_metrics)
+    std_after = np.empty(n_metrics)
     
-    for config in analyses_config:
-        # Extraction des données
-        times_avant, data_avant = extract_thickness_data(
-            csv_file_1, config['column_index'], config['min_columns'], config['is_percentage']
-        )
-        times_apres, data_apres = extract_thickness_data(
-            csv_file_2, config['column_index'], config['min_columns'], config['is_percentage']
-        )
-        
-        # Calcul des statistiques
-        stats_avant, stats_apres = calculate_statistics(data_avant, data_apres, config['is_percentage'])
+    for i, result in enumerate(results):
+        stats_avant = result['stats_avant']
+        stats_apres = result['stats_apres']
         
         # Détermination de l'amélioration
-        if config['is_percentage']:
+        if result['is_percentage']:
             improvement = 'Amélioration' if stats_apres['Moyenne'] > stats_avant['Moyenne'] else 'Dégradation'
         else:
             improvement = 'Amélioration' if stats_apres['Écart-type'] < stats_avant['Écart-type'] else 'Dégradation'
         
-        # Stockage des résultats
-        summary_data.append({
-            'metric': config['title'],
-            'mean_before': stats_avant['Moyenne'],
-            'mean_after': stats_apres['Moyenne'],
-            'mean_diff': stats_apres['Moyenne'] - stats_avant['Moyenne'],
-            'std_before': stats_avant['Écart-type'],
-            'std_after': stats_apres['Écart-type'],
-            'std_diff': stats_apres['Écart-type'] - stats_avant['Écart-type'],
-            'improvement': improvement
-        })
+        # Stockage des résultats (une colonne par grandeur)
+        metric_names.append(result['title'])
+        improvements.append(improvement)
+        mean_before[i] = stats_avant['Moyenne']
+        mean_after[i] = stats_apres['Moyenne']
+        std_before[i] = stats_avant['Écart-type']
+        std_after[i] = stats_apres['Écart-type']
+    
+    summary_data = {
+        'metric': metric_names,
+        'mean_before': mean_before,
+        'mean_after': mean_after,
+        'mean_diff': mean_after - mean_before,
+        'std_before': std_before,
+        'std_after': std_after,
+        'std_diff': std_after - std_before,
+        'improvement': improvements
+    }
     
     # Affichage du tableau résumé
     print(f"{'Métrique':<35} {'Moy. Avant':<12} {'Moy. Après':<12} {'Δ Moyenne':<12} {'Évolution':<12}")
     print("-" * 80)
     
-    for data in summary_data:
-        print(f"{data['metric']:<35} {data['mean_before']:<12.2f} {data['mean_after']:<12.2f} "
-              f"{data['mean_diff']:<+12.2f} {data['improvement']:<12}")
+    for i in range(n_metrics):
+        print(f"{metric_names[i]:<35} {mean_before[i]:<12.2f} {mean_after[i]:<12.2f} "
+              f"{summary_data['mean_diff'][i]:<+12.2f} {improvements[i]:<12}")
     
     # Graphique résumé
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+    fig, ((ax1, ax2),) = _get_figure('summary', 1, 2, figsize=(16, 6))
     
     # Graphique des moyennes
-    metrics = [data['metric'].replace('TRSF_ThicknessBottles', 'Capteur').replace('[', '').replace(']', '') for data in summary_data]
-    means_before = [data['mean_before'] for data in summary_data]
-    means_after = [data['mean_after'] for data in summary_data]
+    metrics = [name.replace('TRSF_ThicknessBottles', 'Capteur').replace('[', '').replace(']', '') for name in metric_names]
     
     x = np.arange(len(metrics))
     width = 0.35
     
-    ax1.bar(x - width/2, means_before, width, label='Avant', color='red', alpha=0.7)
-    ax1.bar(x + width/2, means_after, width, label='Après', color='green', alpha=0.7)
+    ax1.bar(x - width/2, mean_before, width, label='Avant', color='red', alpha=0.7)
+    ax1.bar(x + width/2, mean_after, width, label='Après', color='green', alpha=0.7)
     ax1.set_xlabel('Métriques')
     ax1.set_ylabel('Valeurs moyennes')
     ax1.set_title('Comparaison des moyennes par métrique')
@@ -451,11 +1231,8 @@ def create_summary_analysis(csv_file_1: str, csv_file_2: str, analyses_config: L
     ax1.grid(True, alpha=0.3)
     
     # Graphique des écarts-types
-    stds_before = [data['std_before'] for data in summary_data]
-    stds_after = [data['std_after'] for data in summary_data]
-    
-    ax2.bar(x - width/2, stds_before, width, label='Avant', color='red', alpha=0.7)
-    ax2.bar(x + width/2, stds_after, width, label='Après', color='green', alpha=0.7)
+    ax2.bar(x - width/2, std_before, width, label='Avant', color='red', alpha=0.7)
+    ax2.bar(x + width/2, std_after, width, label='Après', color='green', alpha=0.7)
     ax2.set_xlabel('Métriques')
     ax2.set_ylabel('Écarts-types')
     ax2.set_title('Comparaison de la variabilité par métrique')
@@ -464,12 +1241,37 @@ def create_summary_analysis(csv_file_1: str, csv_file_2: str, analyses_config: L
     ax2.legend()
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.show()
+    _show_figure(fig, 'resume')
     
     return summary_data
 
 
+def precompute_statistics(csv_file_1: str, csv_file_2: str,
+                          analyses_config: List[Dict[str, Any]]) -> None:
+    """
+    Remplit les caches de lecture et de statistiques de toutes les métriques
+    
+    Les métriques sont indépendantes mais partagent les deux mêmes fichiers : des
+    processus séparés reliraient chacun les CSV et renverraient les matrices par pickle.
+    Les deux fichiers sont lus en parallèle par des threads (pyarrow et pandas relâchent
+    le GIL), puis les statistiques sont calculées à la suite : le noyau Numba est déjà
+    parallèle et ne doit pas être lancé depuis plusieurs threads à la fois.
+    Les appels suivants à analyze_thickness_data trouvent tout en cache.
+    
+    Args:
+        csv_file_1: Chemin vers le premier fichier CSV
+        csv_file_2: Chemin vers le deuxième fichier CSV
+        analyses_config: Configurations des analyses (column_index, min_columns, is_percentage)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(_load_thickness_file, (csv_file_1, csv_file_2)))
+    
+    for config in analyses_config:
+        for csv_file in (csv_file_1, csv_file_2):
+            column_statistics(csv_file, config['column_index'], config['min_columns'],
+                              config['is_percentage'])
+
+
 def main():
     """
     Fonction principale pour exécuter toutes les analyses
@@ -525,6 +1327,10 @@ def main():
         }
     ]
     
+    # Lecture des deux fichiers en parallèle, puis statistiques de chaque métrique à la
+    # suite ; affichages et graphiques ensuite dans l'ordre, dans le thread principal
+    precompute_statistics(csv_file_1, csv_file_2, analyses_config)
+    
     # Exécution de toutes les analyses
     print("\n🔍 Début de l'analyse comparative des 4 métriques...")
     print("=" * 80)
@@ -549,7 +1355,7 @@ def main():
         print("-" * 80)
     
     # Analyse résumée
-    summary_results = create_summary_analysis(csv_file_1, csv_file_2, analyses_config)
+    summary_results = create_summary_analysis(results)
     
     print("\n🎉 Toutes les analyses sont terminées!")
     print("=" * 80)